@@ -15,6 +15,10 @@ Key bindings:
   - r:        Refresh the views.
   - q:        Quit.
 
+If libasound and libjack are available, ports and connections are read directly
+from the ALSA sequencer and refreshed automatically whenever the ALSA or JACK
+graph changes.
+
 Ports are drawn with different background colors:
   - ALSA ports: red background.
   - JACK ports: blue background.
@@ -24,182 +28,268 @@ If a panel has more items than can be displayed, it will scroll.
 The default size of the bottom panel has been increased to 8 lines.
 """
 
+import atexit
+import concurrent.futures
+import ctypes
+import ctypes.util
 import curses
+import functools
+import os
+import queue
+import select
+import shlex
+import signal
 import subprocess
 import re
+import sys
+import threading
+import time
+import unicodedata
 
 # -------------------------------
 # Helper classes and functions
 # -------------------------------
 
-# Data structure for ALSA ports.
-class APort:
-    def __init__(self, client, port, name):
-        self.client = client
-        self.port = port
-        self.name = name
+# Regular expressions, compiled once at module load.
+_RE_ALSA_ID = re.compile(r"^\d+:\d+$")
+_RE_JACK_INPUT = re.compile(r"capture|input", re.I)
+_RE_JACK_OUTPUT = re.compile(r"playback|output", re.I)
+
+# Seconds to wait for aconnect/jack_lsp before giving up, so a hung JACK
+# server cannot freeze the UI.
+_QUERY_TIMEOUT = 1.5
+
+# Seconds to wait for a connect/disconnect command. Longer than the query
+# timeout, since reporting an error for a connection that still goes
+# through is worse than a slow status line.
+_ACTION_TIMEOUT = 10.0
 
-    def id(self):
-        """Return the port identifier (format: client:port)."""
-        return f"{self.client}:{self.port}"
+# Parsed results of the ALSA/JACK query commands, keyed by (function name, args).
+# Each entry is a tuple: (monotonic_timestamp, parsed_result)
+_CACHE = {}
 
-    def display(self):
-        """Return a display string combining the ID and the port name."""
-        return f"{self.id()}  {self.name}"
+def ttl_cache(seconds):
+    """
+    Decorator caching a query function's result for the given number of seconds,
+    so redraws and navigation keys do not spawn aconnect/jack_lsp every time.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (func.__name__,) + args
+            now = time.monotonic()
+            entry = _CACHE.get(key)
+            if entry is not None and now - entry[0] < seconds:
+                return entry[1]
+            result = func(*args)
+            # Stamp after the call so a slow query still gets its full lifetime.
+            _CACHE[key] = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
 
-def parse_aconnect_output(output):
-    """Parse output from 'aconnect -i' or 'aconnect -o' into a list of APort objects."""
+def invalidate(*funcs):
+    """
+    Drop cached query results (used after refresh, connect and disconnect).
+    If query functions are given, only their results are dropped.
+    """
+    if not funcs:
+        _CACHE.clear()
+        return
+    names = {func.__name__ for func in funcs}
+    for key in [key for key in _CACHE if key[0] in names]:
+        del _CACHE[key]
+
+def alsa_port_entry(client, port, name):
+    """
+    Return the UI entry for an ALSA port: (display_string, "ALSA", connection_id),
+    where connection_id has the format client:port.
+    """
+    port_id = f"{client}:{port}"
+    return (f"{port_id}  {name}", "ALSA", port_id)
+
+def _scan_digits(buf, pos, end):
+    """Return (digits, new_pos) for the run of ASCII digits in buf starting at pos."""
+    start = pos
+    while pos < end and 0x30 <= buf[pos] <= 0x39:
+        pos += 1
+    return buf[start:pos].decode("ascii"), pos
+
+def _scan_aconnect(buf):
+    """
+    Scan the raw bytes printed by "aconnect -l" in a single pass and return a
+    tuple (inputs, outputs, connections).
+    inputs and outputs are lists of alsa_port_entry() tuples; connections is a
+    list of connection strings like "16:0 -> 128:0".
+    "aconnect -l" does not report port capabilities, so every port is treated
+    as bidirectional and appears in both inputs and outputs.
+    """
     ports = []
+    connections = []
+    seen = set()
     current_client = None
-    for line in output.splitlines():
-        line = line.rstrip()
-        if line.startswith("client"):
-            m = re.match(r"client\s+(\d+):\s+'([^']+)'", line)
-            if m:
-                current_client = m.group(1)
-        elif re.match(r"^\s*\d+", line):
-            m = re.match(r"\s*(\d+)\s+'([^']+)'", line)
-            if m and current_client is not None:
-                port_num = m.group(1)
-                port_name = m.group(2)
-                ports.append(APort(current_client, port_num, port_name))
-    return ports
-
-def get_alsa_ports(direction):
-    """Return a list of APort objects for ALSA; direction should be '-i' or '-o'."""
-    try:
-        output = subprocess.check_output(["aconnect", direction]).decode("utf-8", errors="ignore")
-        return parse_aconnect_output(output)
-    except Exception:
-        return []
+    current_port = None
+    pos = 0
+    size = len(buf)
+    while pos < size:
+        end = buf.find(b"\n", pos)
+        if end < 0:
+            end = size
+        while pos < end and buf[pos] in b" \t":
+            pos += 1
+        if buf.startswith(b"client ", pos):
+            # client 14: 'Midi Through' [type=kernel]
+            pos += 7
+            while pos < end and buf[pos] == 0x20:
+                pos += 1
+            digits, pos = _scan_digits(buf, pos, end)
+            if digits and buf.startswith(b":", pos):
+                current_client = digits
+            current_port = None
+        elif pos < end and 0x30 <= buf[pos] <= 0x39:
+            #     0 'Midi Through Port-0'
+            digits, pos = _scan_digits(buf, pos, end)
+            while pos < end and buf[pos] in b" \t":
+                pos += 1
+            if buf.startswith(b"'", pos):
+                close = buf.find(b"'", pos + 1, end)
+                if close > pos + 1:
+                    current_port = digits
+                    if current_client is not None:
+                        name = buf[pos + 1:close].decode("utf-8", errors="ignore")
+                        ports.append(alsa_port_entry(current_client, current_port, name))
+        elif buf.startswith(b"Connecting To:", pos) or buf.startswith(b"Connected From:", pos):
+            # 	Connecting To: 128:0[real:0], 129:0
+            outgoing = buf.startswith(b"Connecting To:", pos)
+            pos = buf.index(b":", pos) + 1
+            if current_client is not None and current_port is not None:
+                here = f"{current_client}:{current_port}"
+                while pos < end:
+                    while pos < end and buf[pos] == 0x20:
+                        pos += 1
+                    client, pos = _scan_digits(buf, pos, end)
+                    if not client or not buf.startswith(b":", pos):
+                        break
+                    port, pos = _scan_digits(buf, pos + 1, end)
+                    if not port:
+                        break
+                    there = f"{client}:{port}"
+                    src, dst = (here, there) if outgoing else (there, here)
+                    if (src, dst) not in seen:
+                        seen.add((src, dst))
+                        connections.append(f"{src} -> {dst}")
+                    # Skip any "[real:N]" suffix up to the next entry.
+                    comma = buf.find(b",", pos, end)
+                    if comma < 0:
+                        break
+                    pos = comma + 1
+        pos = end + 1
+    return ports, ports, connections
 
-def get_jack_ports():
+def _run_aconnect_l():
     """
-    Return a tuple (jack_outputs, jack_inputs) using jack_lsp.
-    Standard error is suppressed.
+    Run "aconnect -l" once and return its parsed (inputs, outputs, connections).
+    All ALSA port and connection queries are served from this single call.
+    Standard error is suppressed; errors and timeouts yield empty lists.
     """
     try:
-        out = subprocess.check_output(["jack_lsp"], stderr=subprocess.DEVNULL)\
-                       .decode("utf-8", errors="ignore")
-        port_list = [line.strip() for line in out.splitlines() if line.strip()]
-        outputs = []
-        inputs = []
-        for port in port_list:
-            lower = port.lower()
-            if "capture" in lower or "input" in lower:
-                inputs.append(port)
-            elif "playback" in lower or "output" in lower:
-                outputs.append(port)
-            else:
-                outputs.append(port)
-                inputs.append(port)
-        def unique(seq):
-            seen = set()
-            res = []
-            for item in seq:
-                if item not in seen:
-                    res.append(item)
-                    seen.add(item)
-            return res
-        return unique(outputs), unique(inputs)
+        output = subprocess.check_output(["aconnect", "-l"], stderr=subprocess.DEVNULL,
+                                         timeout=_QUERY_TIMEOUT)
+        return _scan_aconnect(output)
     except Exception:
-        return [], []
+        return [], [], []
 
-def get_all_input_ports():
+@ttl_cache(seconds=2.0)
+def _query_alsa():
     """
-    Combine ALSA and JACK input ports into a single list.
-    Each entry is a tuple: (display_string, port_type, connection_id)
+    Return the ALSA (inputs, outputs, connections), read directly from the
+    sequencer through libasound when possible and from "aconnect -l" otherwise.
     """
-    ports = []
-    for p in get_alsa_ports("-i"):
-        ports.append((p.display(), "ALSA", p.id()))
-    jack_outputs, jack_inputs = get_jack_ports()
-    for port in jack_inputs:
-        ports.append((port, "JACK", port))
-    return ports
+    seq = get_alsa_sequencer()
+    if seq.available:
+        return seq.snapshot()
+    return _run_aconnect_l()
 
-def get_all_output_ports():
+def _parse_jack_lsp_c(output):
     """
-    Combine ALSA and JACK output ports into a single list.
-    Each entry is a tuple: (display_string, port_type, connection_id)
+    Parse output from "jack_lsp -c" into a tuple (jack_outputs, jack_inputs, connections).
+    An unindented line is a port; the indented lines that follow it are the
+    ports it is connected to. Each connection is returned as "source -> destination".
     """
-    ports = []
-    for p in get_alsa_ports("-o"):
-        ports.append((p.display(), "ALSA", p.id()))
-    jack_outputs, jack_inputs = get_jack_ports()
-    for port in jack_outputs:
-        ports.append((port, "JACK", port))
-    return ports
+    port_list = []
+    connections = []
+    current_source = None
+    for line in output.splitlines():
+        if line and not line.startswith(" "):
+            current_source = line.strip()
+            if current_source:
+                port_list.append(current_source)
+        elif line.startswith(" ") and current_source is not None:
+            dest = line.strip()
+            if dest:
+                connections.append(f"{current_source} -> {dest}")
+    outputs = []
+    inputs = []
+    for port in port_list:
+        if _RE_JACK_INPUT.search(port):
+            inputs.append(port)
+        elif _RE_JACK_OUTPUT.search(port):
+            outputs.append(port)
+        else:
+            outputs.append(port)
+            inputs.append(port)
+    # dict.fromkeys() drops duplicates while keeping the original order.
+    return list(dict.fromkeys(outputs)), list(dict.fromkeys(inputs)), connections
 
-def get_active_connections_alsa():
+@ttl_cache(seconds=2.0)
+def _run_jack_lsp_c():
     """
-    Parse "aconnect -l" to obtain active ALSA connections.
-    Returns a list of connection strings like "16:0 -> 128:0".
+    Run "jack_lsp -c" once and return its parsed (jack_outputs, jack_inputs, connections).
+    All JACK port and connection queries are served from this single call.
+    Standard error is suppressed; errors and timeouts yield empty lists.
     """
     try:
-        output = subprocess.check_output(["aconnect", "-l"]).decode("utf-8", errors="ignore")
-        lines = output.splitlines()
-        connections = []
-        current_client = None
-        current_port = None
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("client"):
-                m = re.match(r"client\s+(\d+):", stripped)
-                if m:
-                    current_client = m.group(1)
-                current_port = None
-            elif re.match(r"^\d+\s+'", stripped):
-                m = re.match(r"^(\d+)\s+'", stripped)
-                if m:
-                    current_port = m.group(1)
-            elif "Connecting To:" in line:
-                m = re.search(r"Connecting To:\s*(\d+:\d+)", line)
-                if m and current_client is not None and current_port is not None:
-                    src = f"{current_client}:{current_port}"
-                    dst = m.group(1)
-                    conn = f"{src} -> {dst}"
-                    if conn not in connections:
-                        connections.append(conn)
-            elif "Connected From:" in line:
-                m = re.search(r"Connected From:\s*(\d+:\d+)", line)
-                if m and current_client is not None and current_port is not None:
-                    dst = f"{current_client}:{current_port}"
-                    src = m.group(1)
-                    conn = f"{src} -> {dst}"
-                    if conn not in connections:
-                        connections.append(conn)
-        return connections
+        output = subprocess.check_output(["jack_lsp", "-c"], stderr=subprocess.DEVNULL,
+                                         encoding="utf-8", errors="ignore",
+                                         timeout=_QUERY_TIMEOUT)
+        return _parse_jack_lsp_c(output)
     except Exception:
-        return []
+        return [], [], []
 
-def get_active_connections_jack():
+def get_all_ports(alsa, jack):
     """
-    Return a list of active JACK connections by parsing the output of "jack_lsp --connections".
-    The output is assumed to be grouped: an unindented line is a source port,
-    and subsequent indented lines are destination ports.
-    Each connection is returned as "source -> destination".
+    Combine ALSA and JACK ports into a tuple (input_ports, output_ports), given
+    the results of _query_alsa() and _run_jack_lsp_c().
+    Each entry is a tuple: (display_string, port_type, connection_id)
     """
-    try:
-        output = subprocess.check_output(["jack_lsp", "--connections"], stderr=subprocess.DEVNULL)\
-                        .decode("utf-8", errors="ignore")
-        lines = output.splitlines()
-        connections = []
-        current_source = None
-        for line in lines:
-            if line and not line.startswith(" "):
-                current_source = line.strip()
-            elif line.startswith(" ") and current_source is not None:
-                dest = line.strip()
-                if dest:
-                    connections.append(f"{current_source} -> {dest}")
-        return connections
-    except Exception:
-        return []
+    alsa_inputs, alsa_outputs, _ = alsa
+    jack_outputs, jack_inputs, _ = jack
+    inputs = alsa_inputs + [(port, "JACK", port) for port in jack_inputs]
+    outputs = alsa_outputs + [(port, "JACK", port) for port in jack_outputs]
+    return inputs, outputs
+
+def get_all_active_connections(alsa, jack):
+    """
+    Combine active connections from ALSA and JACK, given the results of
+    _query_alsa() and _run_jack_lsp_c(), e.g. "16:0 -> 128:0".
+    """
+    _, _, alsa_connections = alsa
+    _, _, jack_connections = jack
+    return alsa_connections + jack_connections
 
-def get_all_active_connections():
-    """Combine active connections from ALSA and JACK."""
-    return get_active_connections_alsa() + get_active_connections_jack()
+# The ALSA and JACK queries are independent, so they run side by side.
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+def query_all():
+    """
+    Run the ALSA and JACK queries concurrently and return their results as a
+    tuple (alsa, jack) for get_all_ports() and get_all_active_connections();
+    a refresh then takes as long as the slower of the two. Each query is
+    bounded by its own timeout.
+    """
+    alsa_future = _POOL.submit(_query_alsa)
+    jack_future = _POOL.submit(_run_jack_lsp_c)
+    return alsa_future.result(), jack_future.result()
 
 def determine_connection_color(conn_line):
     """
@@ -211,41 +301,109 @@ def determine_connection_color(conn_line):
     if len(parts) < 2:
         return curses.A_NORMAL
     src = parts[0].strip()
-    if re.match(r"^\d+:\d+$", src):
+    if _RE_ALSA_ID.match(src):
         return curses.color_pair(1)
     else:
         return curses.color_pair(2)
 
+class ShellProcess:
+    """
+    A long-lived /bin/sh used to run the connect/disconnect commands, so Python
+    does not have to start a new process for every c/d keypress.
+    Each command is followed by a sentinel echo carrying its exit status, which a
+    reader thread hands back through a queue. The shell is (re)started on demand.
+    """
+    SENTINEL = "__DONE__:"
+
+    def __init__(self):
+        self._proc = None
+        self._lines = None
+
+    def _start(self):
+        self._proc = subprocess.Popen(["/bin/sh"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True, bufsize=1,
+                                      start_new_session=True)
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read, args=(self._proc.stdout, self._lines),
+                         daemon=True).start()
+
+    @staticmethod
+    def _read(stream, lines):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def check_call(self, cmd, timeout=_ACTION_TIMEOUT):
+        """
+        Run cmd (a list of arguments) in the shell with its output discarded.
+        Raises CalledProcessError on a non-zero exit status and TimeoutExpired
+        if the command does not finish in time, like subprocess.check_call().
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+        self._proc.stdin.write(f"{shlex.join(cmd)} >/dev/null 2>&1; echo {self.SENTINEL}$?\n")
+        self._proc.stdin.flush()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                # The command hangs; kill it with the shell so the next call starts afresh.
+                self.close()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if line is None:
+                raise subprocess.CalledProcessError(-1, cmd)
+            if line.startswith(self.SENTINEL):
+                status = int(line[len(self.SENTINEL):])
+                if status != 0:
+                    raise subprocess.CalledProcessError(status, cmd)
+                return
+
+    def close(self):
+        """Terminate the shell and any command still running in it."""
+        if self._proc is not None:
+            # The shell leads its own session, so its process group holds the
+            # shell and the commands it started.
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self._proc.wait()
+            self._proc = None
+
+_SHELL = ShellProcess()
+atexit.register(_SHELL.close)
+
 def alsa_connect(src, dst):
     """Connect two ALSA ports using aconnect."""
     try:
-        subprocess.check_call(["aconnect", src, dst])
+        _SHELL.check_call(["aconnect", src, dst])
         return True, "Connected (ALSA)."
-    except subprocess.CalledProcessError as e:
+    except (subprocess.SubprocessError, OSError) as e:
         return False, f"ALSA connect error: {e}"
 
 def alsa_disconnect(src, dst):
     """Disconnect two ALSA ports using aconnect."""
     try:
-        subprocess.check_call(["aconnect", "-d", src, dst])
+        _SHELL.check_call(["aconnect", "-d", src, dst])
         return True, "Disconnected (ALSA)."
-    except subprocess.CalledProcessError as e:
+    except (subprocess.SubprocessError, OSError) as e:
         return False, f"ALSA disconnect error: {e}"
 
 def jack_connect(src, dst):
-    """Connect two JACK ports using jack_connect (stderr suppressed)."""
+    """Connect two JACK ports using jack_connect."""
     try:
-        subprocess.check_call(["jack_connect", src, dst], stderr=subprocess.DEVNULL)
+        _SHELL.check_call(["jack_connect", src, dst])
         return True, "Connected (JACK)."
-    except subprocess.CalledProcessError as e:
+    except (subprocess.SubprocessError, OSError) as e:
         return False, f"JACK connect error: {e}"
 
 def jack_disconnect(src, dst):
-    """Disconnect two JACK ports using jack_disconnect (stderr suppressed)."""
+    """Disconnect two JACK ports using jack_disconnect."""
     try:
-        subprocess.check_call(["jack_disconnect", src, dst], stderr=subprocess.DEVNULL)
+        _SHELL.check_call(["jack_disconnect", src, dst])
         return True, "Disconnected (JACK)."
-    except subprocess.CalledProcessError as e:
+    except (subprocess.SubprocessError, OSError) as e:
         return False, f"JACK disconnect error: {e}"
 
 def disconnect_connection(conn_line):
@@ -257,14 +415,450 @@ def disconnect_connection(conn_line):
         return False, "Invalid connection format."
     src = parts[0].strip()
     dst = parts[1].strip()
-    if re.match(r"^\d+:\d+$", src):
+    if _RE_ALSA_ID.match(src):
         return alsa_disconnect(src, dst)
     else:
         return jack_disconnect(src, dst)
 
+# -------------------------------
+# ALSA sequencer access (libasound)
+# -------------------------------
+
+# Constants from alsa/seq.h.
+_SND_SEQ_OPEN_DUPLEX = 3
+_SND_SEQ_NONBLOCK = 1
+_SND_SEQ_CLIENT_SYSTEM = 0
+_SND_SEQ_PORT_SYSTEM_ANNOUNCE = 1
+_SND_SEQ_PORT_CAP_READ = 1 << 0
+_SND_SEQ_PORT_CAP_WRITE = 1 << 1
+_SND_SEQ_PORT_CAP_SUBS_READ = 1 << 5
+_SND_SEQ_PORT_CAP_SUBS_WRITE = 1 << 6
+_SND_SEQ_PORT_CAP_NO_EXPORT = 1 << 7
+_SND_SEQ_PORT_TYPE_APPLICATION = 1 << 20
+_SND_SEQ_QUERY_SUBS_READ = 0
+_SND_SEQ_QUERY_SUBS_WRITE = 1
+_POLLIN = 0x001
+
+class _SndSeqAddr(ctypes.Structure):
+    _fields_ = [("client", ctypes.c_ubyte), ("port", ctypes.c_ubyte)]
+
+class _PollFd(ctypes.Structure):
+    _fields_ = [("fd", ctypes.c_int), ("events", ctypes.c_short), ("revents", ctypes.c_short)]
+
+# snd_lib_error_handler_t; the trailing varargs of the real signature are ignored.
+_SndLibErrorHandler = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                                       ctypes.c_int, ctypes.c_char_p)
+
+# libasound prints errors such as "open /dev/snd/seq failed" straight to stderr,
+# i.e. over the curses screen. The handler is process-wide, so the no-op
+# callback lives at module level for as long as libasound may call it.
+_alsa_silence = _SndLibErrorHandler(lambda file, line, function, err, fmt: None)
+
+class AlsaSequencer:
+    """
+    Query the ALSA sequencer directly through libasound instead of running aconnect,
+    and watch the System:Announce port for client, port and subscription changes.
+    If libasound or the sequencer device is not available, `available` is False
+    and callers fall back to "aconnect -l".
+    """
+
+    def __init__(self, client_name="patchbay-ui"):
+        self.available = False
+        self._lib = None
+        self._seq = None
+        self._client_id = -1
+        self._fd = -1
+        path = ctypes.util.find_library("asound")
+        if not path:
+            return
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            return
+        self._declare(lib)
+        lib.snd_lib_error_set_handler(_alsa_silence)
+        seq = ctypes.c_void_p()
+        if lib.snd_seq_open(ctypes.byref(seq), b"default", _SND_SEQ_OPEN_DUPLEX, _SND_SEQ_NONBLOCK) < 0:
+            return
+        self._lib = lib
+        self._seq = seq
+        atexit.register(self.close)
+        lib.snd_seq_set_client_name(seq, client_name.encode("utf-8"))
+        self._client_id = lib.snd_seq_client_id(seq)
+        # A hidden port subscribed to System:Announce receives a message whenever
+        # a client or port appears or disappears, or a connection changes.
+        port = lib.snd_seq_create_simple_port(
+            seq, b"announce",
+            _SND_SEQ_PORT_CAP_WRITE | _SND_SEQ_PORT_CAP_SUBS_WRITE | _SND_SEQ_PORT_CAP_NO_EXPORT,
+            _SND_SEQ_PORT_TYPE_APPLICATION)
+        if port >= 0 and lib.snd_seq_connect_from(seq, port, _SND_SEQ_CLIENT_SYSTEM,
+                                                  _SND_SEQ_PORT_SYSTEM_ANNOUNCE) >= 0:
+            pfd = _PollFd()
+            if lib.snd_seq_poll_descriptors(seq, ctypes.byref(pfd), 1, _POLLIN) == 1:
+                self._fd = pfd.fd
+        self.available = True
+
+    @staticmethod
+    def _declare(lib):
+        """Set the ctypes signatures of the libasound functions used here."""
+        p = ctypes.c_void_p
+        pp = ctypes.POINTER(ctypes.c_void_p)
+        addr_p = ctypes.POINTER(_SndSeqAddr)
+        signatures = {
+            "snd_lib_error_set_handler": (ctypes.c_int, [_SndLibErrorHandler]),
+            "snd_seq_open": (ctypes.c_int, [pp, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]),
+            "snd_seq_close": (ctypes.c_int, [p]),
+            "snd_seq_set_client_name": (ctypes.c_int, [p, ctypes.c_char_p]),
+            "snd_seq_client_id": (ctypes.c_int, [p]),
+            "snd_seq_create_simple_port": (ctypes.c_int, [p, ctypes.c_char_p, ctypes.c_uint, ctypes.c_uint]),
+            "snd_seq_connect_from": (ctypes.c_int, [p, ctypes.c_int, ctypes.c_int, ctypes.c_int]),
+            "snd_seq_poll_descriptors": (ctypes.c_int, [p, ctypes.POINTER(_PollFd), ctypes.c_uint,
+                                                        ctypes.c_short]),
+            "snd_seq_event_input_pending": (ctypes.c_int, [p, ctypes.c_int]),
+            "snd_seq_drop_input": (ctypes.c_int, [p]),
+            "snd_seq_client_info_malloc": (ctypes.c_int, [pp]),
+            "snd_seq_client_info_free": (None, [p]),
+            "snd_seq_client_info_set_client": (None, [p, ctypes.c_int]),
+            "snd_seq_client_info_get_client": (ctypes.c_int, [p]),
+            "snd_seq_query_next_client": (ctypes.c_int, [p, p]),
+            "snd_seq_port_info_malloc": (ctypes.c_int, [pp]),
+            "snd_seq_port_info_free": (None, [p]),
+            "snd_seq_port_info_set_client": (None, [p, ctypes.c_int]),
+            "snd_seq_port_info_set_port": (None, [p, ctypes.c_int]),
+            "snd_seq_port_info_get_port": (ctypes.c_int, [p]),
+            "snd_seq_port_info_get_name": (ctypes.c_char_p, [p]),
+            "snd_seq_port_info_get_capability": (ctypes.c_uint, [p]),
+            "snd_seq_port_info_get_addr": (addr_p, [p]),
+            "snd_seq_query_next_port": (ctypes.c_int, [p, p]),
+            "snd_seq_query_subscribe_malloc": (ctypes.c_int, [pp]),
+            "snd_seq_query_subscribe_free": (None, [p]),
+            "snd_seq_query_subscribe_set_root": (None, [p, addr_p]),
+            "snd_seq_query_subscribe_set_type": (None, [p, ctypes.c_int]),
+            "snd_seq_query_subscribe_set_index": (None, [p, ctypes.c_int]),
+            "snd_seq_query_subscribe_get_addr": (addr_p, [p]),
+            "snd_seq_query_port_subscribers": (ctypes.c_int, [p, p]),
+        }
+        for name, (restype, argtypes) in signatures.items():
+            func = getattr(lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
+
+    def fileno(self):
+        """Return the file descriptor that becomes readable on announce events, or -1."""
+        return self._fd
+
+    def drain(self):
+        """Discard pending announce events; return True if there were any."""
+        if self._fd < 0:
+            return False
+        pending = self._lib.snd_seq_event_input_pending(self._seq, 1)
+        self._lib.snd_seq_drop_input(self._seq)
+        # A negative result (e.g. input overrun) also means something changed.
+        return pending != 0
+
+    def snapshot(self):
+        """
+        Return the current graph as a tuple (inputs, outputs, connections), like
+        "aconnect -i", "aconnect -o" and "aconnect -l" would list it, with the
+        ports as alsa_port_entry() tuples.
+        """
+        lib = self._lib
+        seq = self._seq
+        inputs = []
+        outputs = []
+        connections = []
+        seen = set()
+        cinfo = ctypes.c_void_p()
+        pinfo = ctypes.c_void_p()
+        subs = ctypes.c_void_p()
+        lib.snd_seq_client_info_malloc(ctypes.byref(cinfo))
+        lib.snd_seq_port_info_malloc(ctypes.byref(pinfo))
+        lib.snd_seq_query_subscribe_malloc(ctypes.byref(subs))
+        try:
+            lib.snd_seq_client_info_set_client(cinfo, -1)
+            while lib.snd_seq_query_next_client(seq, cinfo) >= 0:
+                client = lib.snd_seq_client_info_get_client(cinfo)
+                if client == self._client_id:
+                    continue
+                lib.snd_seq_port_info_set_client(pinfo, client)
+                lib.snd_seq_port_info_set_port(pinfo, -1)
+                while lib.snd_seq_query_next_port(seq, pinfo) >= 0:
+                    caps = lib.snd_seq_port_info_get_capability(pinfo)
+                    if caps & _SND_SEQ_PORT_CAP_NO_EXPORT:
+                        continue
+                    port = lib.snd_seq_port_info_get_port(pinfo)
+                    name = (lib.snd_seq_port_info_get_name(pinfo) or b"").decode("utf-8", errors="ignore")
+                    entry = alsa_port_entry(client, port, name)
+                    readable = _SND_SEQ_PORT_CAP_READ | _SND_SEQ_PORT_CAP_SUBS_READ
+                    writable = _SND_SEQ_PORT_CAP_WRITE | _SND_SEQ_PORT_CAP_SUBS_WRITE
+                    if caps & readable == readable:
+                        inputs.append(entry)
+                    if caps & writable == writable:
+                        outputs.append(entry)
+                    root = lib.snd_seq_port_info_get_addr(pinfo)
+                    for subs_type in (_SND_SEQ_QUERY_SUBS_READ, _SND_SEQ_QUERY_SUBS_WRITE):
+                        lib.snd_seq_query_subscribe_set_root(subs, root)
+                        lib.snd_seq_query_subscribe_set_type(subs, subs_type)
+                        index = 0
+                        lib.snd_seq_query_subscribe_set_index(subs, index)
+                        while lib.snd_seq_query_port_subscribers(seq, subs) >= 0:
+                            other = lib.snd_seq_query_subscribe_get_addr(subs).contents
+                            if other.client != self._client_id:
+                                here = (client, port)
+                                there = (other.client, other.port)
+                                src, dst = (here, there) if subs_type == _SND_SEQ_QUERY_SUBS_READ \
+                                    else (there, here)
+                                if (src, dst) not in seen:
+                                    seen.add((src, dst))
+                                    connections.append(f"{src[0]}:{src[1]} -> {dst[0]}:{dst[1]}")
+                            index += 1
+                            lib.snd_seq_query_subscribe_set_index(subs, index)
+        finally:
+            lib.snd_seq_query_subscribe_free(subs)
+            lib.snd_seq_port_info_free(pinfo)
+            lib.snd_seq_client_info_free(cinfo)
+        return inputs, outputs, connections
+
+    def close(self):
+        """Close the sequencer handle, if one was opened."""
+        if self._seq:
+            self._lib.snd_seq_close(self._seq)
+            self._seq = None
+            self._fd = -1
+            self.available = False
+
+@functools.lru_cache(maxsize=None)
+def get_alsa_sequencer():
+    """Return the shared AlsaSequencer, opening it on first use."""
+    return AlsaSequencer()
+
+# -------------------------------
+# JACK graph change notifications
+# -------------------------------
+
+# libjack callback signatures (see jack/types.h).
+_JackPortRegistrationCallback = ctypes.CFUNCTYPE(None, ctypes.c_uint32, ctypes.c_int, ctypes.c_void_p)
+_JackPortConnectCallback = ctypes.CFUNCTYPE(None, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int,
+                                            ctypes.c_void_p)
+_JackGraphOrderCallback = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p)
+_JackShutdownCallback = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+_JackMessageCallback = ctypes.CFUNCTYPE(None, ctypes.c_char_p)
+
+# libjack prints errors such as "Cannot connect to server socket" straight to
+# stderr, i.e. over the curses screen. These handlers are process-wide, so the
+# no-op callback lives at module level for as long as libjack may call it.
+_jack_silence = _JackMessageCallback(lambda msg: None)
+
+class JackMonitor:
+    """
+    Watch the JACK graph through libjack callbacks instead of polling jack_lsp.
+    Port registration, port connection and graph order changes write to a
+    self-pipe, so the main loop can select() on fileno() and call drain().
+    The client is opened in a background thread without starting a server;
+    if libjack or a running JACK server is not available the monitor stays idle.
+    """
+    JACK_NO_START_SERVER = 0x01
+
+    def __init__(self, client_name="patchbay-ui"):
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        self._lib = None
+        self._client = None
+        self._callbacks = ()
+        threading.Thread(target=self._open, args=(client_name,), daemon=True).start()
+
+    def _open(self, client_name):
+        path = ctypes.util.find_library("jack")
+        if not path:
+            return
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            return
+        lib.jack_client_open.restype = ctypes.c_void_p
+        lib.jack_client_open.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+        lib.jack_set_port_registration_callback.argtypes = [ctypes.c_void_p,
+                                                            _JackPortRegistrationCallback,
+                                                            ctypes.c_void_p]
+        lib.jack_set_port_connect_callback.argtypes = [ctypes.c_void_p, _JackPortConnectCallback,
+                                                       ctypes.c_void_p]
+        lib.jack_set_graph_order_callback.argtypes = [ctypes.c_void_p, _JackGraphOrderCallback,
+                                                      ctypes.c_void_p]
+        lib.jack_on_shutdown.argtypes = [ctypes.c_void_p, _JackShutdownCallback, ctypes.c_void_p]
+        lib.jack_activate.argtypes = [ctypes.c_void_p]
+        lib.jack_client_close.argtypes = [ctypes.c_void_p]
+        lib.jack_set_error_function.argtypes = [_JackMessageCallback]
+        lib.jack_set_info_function.argtypes = [_JackMessageCallback]
+
+        lib.jack_set_error_function(_jack_silence)
+        lib.jack_set_info_function(_jack_silence)
+        status = ctypes.c_int(0)
+        client = lib.jack_client_open(client_name.encode("utf-8"), self.JACK_NO_START_SERVER,
+                                      ctypes.byref(status))
+        if not client:
+            return
+        # Keep references to the ctypes callbacks for as long as the client lives.
+        self._callbacks = (
+            _JackPortRegistrationCallback(lambda port, register, arg: self._notify()),
+            _JackPortConnectCallback(lambda a, b, connect, arg: self._notify()),
+            _JackGraphOrderCallback(self._on_graph_order),
+            _JackShutdownCallback(self._on_shutdown),
+        )
+        port_registration, port_connect, graph_order, shutdown = self._callbacks
+        lib.jack_set_port_registration_callback(client, port_registration, None)
+        lib.jack_set_port_connect_callback(client, port_connect, None)
+        lib.jack_set_graph_order_callback(client, graph_order, None)
+        lib.jack_on_shutdown(client, shutdown, None)
+        if lib.jack_activate(client) != 0:
+            lib.jack_client_close(client)
+            return
+        self._lib = lib
+        self._client = client
+        atexit.register(self.close)
+
+    def _notify(self):
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            pass  # The pipe is full, so a wakeup is already pending.
+
+    def _on_graph_order(self, arg):
+        self._notify()
+        return 0
+
+    def _on_shutdown(self, arg):
+        # The server went away; the JACK views must be refreshed (and emptied).
+        self._notify()
+
+    def fileno(self):
+        """Return the file descriptor that becomes readable on graph changes."""
+        return self._wakeup_r
+
+    def drain(self):
+        """Consume pending graph change notifications; return True if there were any."""
+        changed = False
+        try:
+            while os.read(self._wakeup_r, 4096):
+                changed = True
+        except BlockingIOError:
+            pass
+        return changed
+
+    def close(self):
+        """Close the JACK client, if one was opened."""
+        if self._client:
+            self._lib.jack_client_close(self._client)
+            self._client = None
+
 # -------------------------------
 # Main curses UI loop (using stdscr directly)
 # -------------------------------
+
+# Header line for each focus value.
+_HEADER_CACHE = {
+    f: f"Focus: {f} | TAB: switch focus | c: connect | d: disconnect | r: refresh | q: quit"
+    for f in ("input", "output", "active")
+}
+
+def _char_width(ch):
+    # Combining marks take no cell of their own; wide and fullwidth characters take two.
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+def display_width(text):
+    """Return the number of terminal cells text occupies (wide characters take two)."""
+    return sum(_char_width(ch) for ch in text)
+
+def clip_to_width(text, cells):
+    """
+    Return the longest prefix of text that fits in the given number of terminal
+    cells, so wide characters never spill into a neighbouring column.
+    """
+    width = 0
+    for i, ch in enumerate(text):
+        width += _char_width(ch)
+        if width > cells:
+            return text[:i]
+    return text
+
+def clip_port_rows(ports, max_width):
+    """
+    Return a (display_text, base_attr) pair for each port tuple, with the text
+    clipped to max_width and the color pair picked by port type.
+    """
+    return [(clip_to_width(display_text, max_width), curses.color_pair(1) if p_type == "ALSA" else curses.color_pair(2))
+            for display_text, p_type, _ in ports]
+
+def clip_connection_rows(conns, max_width):
+    """
+    Return a (conn_text, base_attr) pair for each connection string, with the text
+    clipped to max_width and the color pair from determine_connection_color().
+    """
+    return [(clip_to_width(conn_line, max_width), determine_connection_color(conn_line)) for conn_line in conns]
+
+class ShadowScreen:
+    """
+    Remember what was drawn at each (y, x) position in the previous frame, so a
+    redraw only calls addstr() for text that actually changed.
+    Positions that are not drawn again in a frame are blanked by end_frame().
+    """
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self._prev_cells = {}
+        self._cells = {}
+
+    @staticmethod
+    def _width(cell):
+        # Text cells are (text, attr); horizontal lines are (None, width).
+        text, attr = cell
+        return attr if text is None else display_width(text)
+
+    def _addstr(self, y, x, text, attr=0):
+        try:
+            self.stdscr.addstr(y, x, text, attr)
+        except curses.error:
+            pass  # Writing the bottom-right cell moves the cursor off-screen.
+
+    def put(self, y, x, text, attr=0):
+        """Draw text at (y, x) unless the previous frame drew the same thing there."""
+        cell = (text, attr)
+        self._cells[(y, x)] = cell
+        prev = self._prev_cells.get((y, x))
+        if prev == cell:
+            return
+        if prev is not None:
+            prev_width = self._width(prev)
+            width = display_width(text)
+            if prev_width > width:
+                self._addstr(y, x + width, " " * (prev_width - width))
+        self._addstr(y, x, text, attr)
+
+    def hline(self, y, x, width):
+        """Draw a horizontal line at (y, x) unless the previous frame drew the same one."""
+        cell = (None, width)
+        self._cells[(y, x)] = cell
+        if self._prev_cells.get((y, x)) != cell:
+            self.stdscr.hline(y, x, curses.ACS_HLINE, width)
+
+    def end_frame(self):
+        """Blank whatever the previous frame drew that this frame did not."""
+        for (y, x), cell in self._prev_cells.items():
+            if (y, x) not in self._cells:
+                self._addstr(y, x, " " * self._width(cell))
+        self._prev_cells = self._cells
+        self._cells = {}
+
+    def reset(self):
+        """
+        Forget the previous frame and repaint the whole terminal on the next
+        refresh (after a resize, or to recover from output drawn over the UI).
+        """
+        self.stdscr.clear()
+        self._prev_cells = {}
+
 def main(stdscr):
     # Initialize curses settings.
     curses.curs_set(0)
@@ -275,6 +869,24 @@ def main(stdscr):
     # Define two color pairs.
     curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_RED)    # ALSA: white on red.
     curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLUE)   # JACK: white on blue.
+    # The main loop select()s on stdin and the ALSA/JACK change fds, so getch()
+    # must never block.
+    stdscr.nodelay(True)
+    jack_monitor = JackMonitor()
+    alsa_seq = get_alsa_sequencer()
+
+    # Handle SIGWINCH in Python so a resize wakes up select() through the wakeup fd.
+    resized = False
+
+    def on_sigwinch(signum, frame):
+        nonlocal resized
+        resized = True
+
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_r, False)
+    os.set_blocking(wakeup_w, False)
+    signal.signal(signal.SIGWINCH, on_sigwinch)
+    signal.set_wakeup_fd(wakeup_w)
 
     status = "Welcome to the unified patchbay!"
     focus = "input"   # can be "input", "output", or "active"
@@ -287,97 +899,174 @@ def main(stdscr):
     offset_output = 0
     offset_active = 0
 
+    # Port and connection lists are only re-enumerated on startup, refresh,
+    # connect/disconnect and terminal resize -- never on plain redraws.
+    input_ports = []
+    output_ports = []
+    active_conns = []
+
+    # Header, port rows and connection rows clipped to the terminal width;
+    # rebuilt only when the focus, the width or the lists change.
+    header_key = None
+    header_text = ""
+    rows_width = None
+    input_rows = []
+    output_rows = []
+    active_rows = []
+
+    # A frame is only drawn when something visible changed (dirty) or the
+    # terminal no longer has the size the last frame was drawn for.
+    dirty = True
+    last_h, last_w = stdscr.getmaxyx()
+
+    def refresh_state():
+        nonlocal input_ports, output_ports, active_conns, rows_width, dirty
+        nonlocal sel_input, sel_output, sel_active
+        rows_width = None
+        dirty = True
+        alsa, jack = query_all()
+        input_ports, output_ports = get_all_ports(alsa, jack)
+        active_conns = get_all_active_connections(alsa, jack)
+        # Keep the selections inside the (possibly shorter) new lists.
+        sel_input = min(sel_input, max(0, len(input_ports) - 1))
+        sel_output = min(sel_output, max(0, len(output_ports) - 1))
+        sel_active = min(sel_active, max(0, len(active_conns) - 1))
+
+    refresh_state()
+
+    shadow = ShadowScreen(stdscr)
+
     while True:
-        stdscr.erase()
-        height, width = stdscr.getmaxyx()
-        # Increase the default bottom panel height to 8 lines.
-        bottom_panel_height = 8 if height >= 16 else max(3, height // 3)
-        patchbay_height = height - bottom_panel_height - 1
-
-        # --- Draw Global Header (row 0) ---
-        header_text = f"Focus: {focus} | TAB: switch focus | c: connect | d: disconnect | r: refresh | q: quit"
-        stdscr.addstr(0, 0, header_text[:width])
-
-        # --- Draw Patchbay (top panel) ---
-        stdscr.addstr(1, 2, "Input Ports")
-        stdscr.addstr(1, width//2 + 2, "Output Ports")
-        input_ports = get_all_input_ports()
-        output_ports = get_all_output_ports()
-        patchbay_list_rows = patchbay_height - 2
-
-        # Update scrolling offsets for input ports.
-        if sel_input < offset_input:
-            offset_input = sel_input
-        elif sel_input >= offset_input + patchbay_list_rows:
-            offset_input = sel_input - patchbay_list_rows + 1
-
-        # Draw visible input ports.
-        for idx in range(offset_input, min(offset_input + patchbay_list_rows, len(input_ports))):
-            y = 2 + (idx - offset_input)
-            x = 2
-            display_text, p_type, _ = input_ports[idx]
-            base_attr = curses.color_pair(1) if p_type == "ALSA" else curses.color_pair(2)
-            if idx == sel_input:
-                attr = base_attr | (curses.A_REVERSE if focus == "input" else curses.A_UNDERLINE)
-            else:
-                attr = base_attr
-            stdscr.addstr(y, x, display_text[:(width//2 - 4)], attr)
-
-        # Update scrolling offsets for output ports.
-        if sel_output < offset_output:
-            offset_output = sel_output
-        elif sel_output >= offset_output + patchbay_list_rows:
-            offset_output = sel_output - patchbay_list_rows + 1
-
-        # Draw visible output ports.
-        for idx in range(offset_output, min(offset_output + patchbay_list_rows, len(output_ports))):
-            y = 2 + (idx - offset_output)
-            x = width//2 + 2
-            display_text, p_type, _ = output_ports[idx]
-            base_attr = curses.color_pair(1) if p_type == "ALSA" else curses.color_pair(2)
-            if idx == sel_output:
-                attr = base_attr | (curses.A_REVERSE if focus == "output" else curses.A_UNDERLINE)
-            else:
-                attr = base_attr
-            stdscr.addstr(y, x, display_text[:(width//2 - 4)], attr)
+        if dirty or curses.is_term_resized(last_h, last_w):
+            height, width = stdscr.getmaxyx()
+            # Increase the default bottom panel height to 8 lines.
+            bottom_panel_height = 8 if height >= 16 else max(3, height // 3)
+            patchbay_height = height - bottom_panel_height - 1
 
-        # --- Draw Horizontal Separator ---
-        stdscr.hline(patchbay_height, 0, curses.ACS_HLINE, width)
+            # --- Draw Global Header (row 0) ---
+            if header_key != (focus, width):
+                header_key = (focus, width)
+                header_text = clip_to_width(_HEADER_CACHE[focus], width)
+            shadow.put(0, 0, header_text)
 
-        # --- Draw Active Connections (bottom panel) ---
-        stdscr.addstr(patchbay_height + 1, 2, "Active Connections")
-        active_conns = get_all_active_connections()
-        active_list_rows = height - (patchbay_height + 2) - 1
+            # --- Draw Patchbay (top panel) ---
+            shadow.put(1, 2, "Input Ports")
+            shadow.put(1, width//2 + 2, "Output Ports")
+            patchbay_list_rows = patchbay_height - 2
+            if rows_width != width:
+                rows_width = width
+                input_rows = clip_port_rows(input_ports, width//2 - 4)
+                output_rows = clip_port_rows(output_ports, width//2 - 4)
+                active_rows = clip_connection_rows(active_conns, width - 4)
 
-        # Update scrolling offsets for active connections.
-        if sel_active < offset_active:
-            offset_active = sel_active
-        elif sel_active >= offset_active + active_list_rows:
-            offset_active = sel_active - active_list_rows + 1
+            # Update scrolling offsets for input ports.
+            if sel_input < offset_input:
+                offset_input = sel_input
+            elif sel_input >= offset_input + patchbay_list_rows:
+                offset_input = sel_input - patchbay_list_rows + 1
 
-        if not active_conns:
-            stdscr.addstr(patchbay_height + 2, 2, "No active connections.")
-        else:
-            for idx in range(offset_active, min(offset_active + active_list_rows, len(active_conns))):
-                y = patchbay_height + 2 + (idx - offset_active)
+            # Draw visible input ports.
+            for idx in range(offset_input, min(offset_input + patchbay_list_rows, len(input_ports))):
+                y = 2 + (idx - offset_input)
                 x = 2
-                conn_text = active_conns[idx][: (width - 4)]
-                base_attr = determine_connection_color(active_conns[idx])
-                if idx == sel_active:
-                    attr = base_attr | (curses.A_REVERSE if focus == "active" else curses.A_UNDERLINE)
+                display_text, base_attr = input_rows[idx]
+                if idx == sel_input:
+                    attr = base_attr | (curses.A_REVERSE if focus == "input" else curses.A_UNDERLINE)
                 else:
                     attr = base_attr
-                stdscr.addstr(y, x, conn_text, attr)
+                shadow.put(y, x, display_text, attr)
 
-        # --- Draw Status Bar (last row) ---
-        stdscr.addstr(height - 1, 0, status[:width])
-        stdscr.refresh()
+            # Update scrolling offsets for output ports.
+            if sel_output < offset_output:
+                offset_output = sel_output
+            elif sel_output >= offset_output + patchbay_list_rows:
+                offset_output = sel_output - patchbay_list_rows + 1
 
-        # --- Handle User Input ---
+            # Draw visible output ports.
+            for idx in range(offset_output, min(offset_output + patchbay_list_rows, len(output_ports))):
+                y = 2 + (idx - offset_output)
+                x = width//2 + 2
+                display_text, base_attr = output_rows[idx]
+                if idx == sel_output:
+                    attr = base_attr | (curses.A_REVERSE if focus == "output" else curses.A_UNDERLINE)
+                else:
+                    attr = base_attr
+                shadow.put(y, x, display_text, attr)
+
+            # --- Draw Horizontal Separator ---
+            shadow.hline(patchbay_height, 0, width)
+
+            # --- Draw Active Connections (bottom panel) ---
+            shadow.put(patchbay_height + 1, 2, "Active Connections")
+            active_list_rows = height - (patchbay_height + 2) - 1
+
+            # Update scrolling offsets for active connections.
+            if sel_active < offset_active:
+                offset_active = sel_active
+            elif sel_active >= offset_active + active_list_rows:
+                offset_active = sel_active - active_list_rows + 1
+
+            if not active_conns:
+                shadow.put(patchbay_height + 2, 2, "No active connections.")
+            else:
+                for idx in range(offset_active, min(offset_active + active_list_rows, len(active_conns))):
+                    y = patchbay_height + 2 + (idx - offset_active)
+                    x = 2
+                    conn_text, base_attr = active_rows[idx]
+                    if idx == sel_active:
+                        attr = base_attr | (curses.A_REVERSE if focus == "active" else curses.A_UNDERLINE)
+                    else:
+                        attr = base_attr
+                    shadow.put(y, x, conn_text, attr)
+
+            # --- Draw Status Bar (last row) ---
+            shadow.put(height - 1, 0, clip_to_width(status, width))
+            shadow.end_frame()
+            stdscr.noutrefresh()
+            curses.doupdate()
+            last_h, last_w = height, width
+            dirty = False
+
+        # --- Wait for a key, an ALSA/JACK graph change or a terminal resize ---
+        # Nothing is redrawn until one of them happens, so an idle patchbay
+        # does not wake up at all.
         key = stdscr.getch()
+        while key == -1:
+            fds = [sys.stdin.fileno(), wakeup_r, jack_monitor.fileno(), alsa_seq.fileno()]
+            readable, _, _ = select.select([fd for fd in fds if fd >= 0], [], [])
+            changed = []
+            if jack_monitor.fileno() in readable and jack_monitor.drain():
+                changed.append(_run_jack_lsp_c)
+            if alsa_seq.fileno() in readable and alsa_seq.drain():
+                changed.append(_query_alsa)
+            if changed:
+                invalidate(*changed)
+                refresh_state()
+                break
+            if wakeup_r in readable:
+                try:
+                    os.read(wakeup_r, 4096)
+                except BlockingIOError:
+                    pass
+                if resized:
+                    resized = False
+                    size = os.get_terminal_size()
+                    curses.resizeterm(size.lines, size.columns)
+                    key = curses.KEY_RESIZE
+                    break
+            key = stdscr.getch()
+        if key == -1:
+            # Only the ALSA/JACK graph changed: redraw.
+            continue
+
+        # --- Handle User Input ---
+        view = (status, focus, sel_input, sel_output, sel_active)
         if key == ord('q'):
             break
         elif key == ord('r'):
+            shadow.reset()
+            invalidate()
+            refresh_state()
             status = "Views refreshed."
         elif key == 9:  # TAB key: cycle focus.
             if focus == "input":
@@ -417,6 +1106,8 @@ def main(stdscr):
                         status = msg
             else:
                 status = "Cannot connect when active connections panel is focused."
+            invalidate()
+            refresh_state()
         elif key == ord('d'):
             if focus == "active":
                 if active_conns:
@@ -441,8 +1132,18 @@ def main(stdscr):
                         else:
                             ok, msg = jack_disconnect(inp[2], outp[2])
                         status = msg
+            invalidate()
+            refresh_state()
+        elif key == curses.KEY_RESIZE:
+            shadow.reset()
+            refresh_state()
         else:
             status = f"Key {key} pressed."
+        if view != (status, focus, sel_input, sel_output, sel_active):
+            dirty = True
+
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGWINCH, signal.SIG_DFL)
 
 if __name__ == '__main__':
     curses.wrapper(main)